@@ -54,6 +54,15 @@ if ! grep -q "^dtparam=spi=on" /boot/config.txt 2>/dev/null; then
     NEED_REBOOT=true
 fi
 
+# Raise the spidev buffer so a whole frame fits in one SPI transfer.
+# bufsiz is a kernel module parameter, so it goes on the kernel command
+# line (config.txt doesn't process module parameters).
+if ! grep -q "spidev.bufsiz=" /boot/cmdline.txt 2>/dev/null; then
+    echo "Setting spidev buffer size (requires sudo and reboot)..."
+    sudo sed -i '1 s/$/ spidev.bufsiz=8192/' /boot/cmdline.txt
+    NEED_REBOOT=true
+fi
+
 # Reload systemd and enable service
 echo "Enabling and starting subway-sign service..."
 sudo systemctl daemon-reload
@@ -5,22 +5,195 @@ Displays subway arrival times on MAX7219 LED matrix via SPI
 """
 
 import argparse
+import logging
 import sys
+import threading
 import time
+from bisect import bisect_left
 from datetime import datetime, time as dt_time
+from functools import lru_cache
 from luma.led_matrix.device import max7219
 from luma.core.interface.serial import spi, noop
-from luma.core.render import canvas
 from luma.core.virtual import viewport
-from luma.core.legacy import text, show_message
+from luma.core.legacy import text, show_message, textsize
 from luma.core.legacy.font import proportional, CP437_FONT, TINY_FONT, SINCLAIR_FONT, LCD_FONT
+from PIL import Image, ImageDraw
+
+try:
+    import spidev
+except ImportError:
+    spidev = None  # fall back to luma's display path
 
 from mta_api import MTAApi
 
 
+log = logging.getLogger(__name__)
+
+
+# Font wrappers built once instead of on every text() call
+TINY = proportional(TINY_FONT)
+SINCLAIR = proportional(SINCLAIR_FONT)
+
+
+@lru_cache(maxsize=64)
+def _text_width(s):
+    """Exact pixel width of s in the proportional tiny font (memoized - only ~20 unique strings)"""
+    return textsize(s, font=TINY)[0]
+
+
+def _make_arrow(rows):
+    """Build a 3x6 1-bit arrow bitmap from rows of 0/1 pixels"""
+    img = Image.new("1", (3, 6))
+    img.putdata([255 if px else 0 for row in rows for px in row])
+    return img
+
+
+# Arrow bitmaps precomputed once so drawing is a single blit instead of
+# seven draw.point() calls (top row left blank to match the text baseline)
+UP_ARROW_IMG = _make_arrow([
+    (0, 0, 0),
+    (0, 1, 0),
+    (1, 1, 1),
+    (0, 1, 0),
+    (0, 1, 0),
+    (0, 1, 0),
+])
+DOWN_ARROW_IMG = _make_arrow([
+    (0, 0, 0),
+    (0, 1, 0),
+    (0, 1, 0),
+    (0, 1, 0),
+    (1, 1, 1),
+    (0, 1, 0),
+])
+
+
+def _glyph_cols(rows):
+    """Convert row strings of 0/1 into per-column bitmask bytes (bit r = row r)"""
+    width = len(rows[0])
+    return tuple(
+        sum(1 << r for r, row in enumerate(rows) if row[c] == "1")
+        for c in range(width)
+    )
+
+
+# 3x5 column bitmaps for every character the estimate page can show.
+# Rendering a glyph is then just ORing 1-3 bytes into the column buffer,
+# instead of the per-glyph layout work in luma's text().
+GLYPHS = {ch: _glyph_cols(rows) for ch, rows in {
+    "0": ("111", "101", "101", "101", "111"),
+    "1": ("010", "110", "010", "010", "111"),
+    "2": ("111", "001", "111", "100", "111"),
+    "3": ("111", "001", "011", "001", "111"),
+    "4": ("101", "101", "111", "001", "001"),
+    "5": ("111", "100", "111", "001", "111"),
+    "6": ("111", "100", "111", "101", "111"),
+    "7": ("111", "001", "001", "010", "010"),
+    "8": ("111", "101", "111", "101", "111"),
+    "9": ("111", "101", "111", "001", "111"),
+    ":": ("0", "1", "0", "1", "0"),
+    "F": ("111", "100", "111", "100", "100"),
+    "M": ("101", "111", "101", "101", "101"),
+    "R": ("110", "101", "110", "101", "101"),
+    "W": ("101", "101", "101", "111", "101"),
+    "C": ("111", "100", "100", "100", "111"),
+    "E": ("111", "100", "111", "100", "111"),
+}.items()}
+
+# Arrow column bitmaps (rows 1-5, matching the PIL arrow bitmaps)
+UP_ARROW_COLS = (0b0000100, 0b0111110, 0b0000100)
+DOWN_ARROW_COLS = (0b0010000, 0b0111110, 0b0010000)
+
+
+def _blit_cols(frame_cols, glyph, x):
+    """OR a glyph's column bytes into the frame at column x"""
+    for i, bits in enumerate(glyph):
+        if 0 <= x + i < len(frame_cols):
+            frame_cols[x + i] |= bits
+
+
+def _draw_string(frame_cols, s, x):
+    """Draw a string of known glyphs, returning the x just past it (1px gaps)"""
+    for ch in s:
+        glyph = GLYPHS[ch]
+        _blit_cols(frame_cols, glyph, x)
+        x += len(glyph) + 1
+    return x
+
+
+def _cols_to_image(frame_cols):
+    """Pack a 32-byte column buffer into a 32x8 1-bit PIL image"""
+    rows = bytearray()
+    for r in range(8):
+        for byte_idx in range(4):
+            b = 0
+            for bit in range(8):
+                if (frame_cols[byte_idx * 8 + bit] >> r) & 1:
+                    b |= 0x80 >> bit
+            rows.append(b)
+    return Image.frombytes("1", (32, 8), bytes(rows))
+
+
+class SpiFrameWriter:
+    """Push rendered frames straight to the cascaded MAX7219s over spidev
+
+    luma's display() walks the framebuffer in Python per refresh; a 32x8
+    1-bit PIL frame is already laid out as 4 row bytes per row, which is
+    exactly the data each chip's digit register wants. The whole frame is
+    composed into one preallocated 64-byte buffer and shifted out as 8
+    writes - the MAX7219 latches one register per chip per CS cycle, so
+    8 chip-select toggles per frame is the hardware minimum.
+
+    luma is still used for device init (shutdown/scan-limit/intensity
+    registers) and for the scrolling/status paths.
+    """
+
+    def __init__(self, port=0, device=0, speed_hz=10_000_000):
+        self._spi = spidev.SpiDev()
+        self._spi.open(port, device)
+        self._spi.max_speed_hz = speed_hz
+        self._payload = bytearray(64)
+
+    def display(self, frame):
+        data = self._reorient(frame).tobytes()  # 4 packed bytes per row
+        payload = self._payload
+        view = memoryview(payload)
+        for row in range(8):
+            reg = row + 1  # digit registers are 1-8
+            base = row * 8
+            for chip in range(4):
+                # bits shifted first land in the chip furthest down the chain
+                payload[base + chip * 2] = reg
+                payload[base + chip * 2 + 1] = data[row * 4 + (3 - chip)]
+            self._spi.writebytes2(view[base:base + 8])
+
+    @staticmethod
+    def _reorient(frame):
+        """Rotate each 8x8 tile to match panels wired block_orientation=-90
+
+        Per-tile ROTATE_180 reproduces the register bytes luma's max7219
+        driver sends for the same frame (combined with the reversed chip
+        order in display()), verified against its preprocess()/display()
+        output byte for byte.
+        """
+        out = Image.new("1", (32, 8))
+        for block in range(4):
+            tile = frame.crop((block * 8, 0, block * 8 + 8, 8))
+            out.paste(tile.transpose(Image.ROTATE_180), (block * 8, 0))
+        return out
+
+
+# Raw SPI writer, set up in main() when spidev is importable
+_raw_writer = None
+
+
 def create_device():
     """Create and configure the LED matrix device"""
-    serial = spi(port=0, device=0, gpio=noop())
+    # Run SCK at 8 MHz - the fastest speed luma supports below the
+    # MAX7219's 10 MHz ceiling - and let each frame go out as one large
+    # SPI transfer instead of several chunked ones
+    serial = spi(port=0, device=0, gpio=noop(),
+                 bus_speed_hz=8_000_000, transfer_size=4096)
     device = max7219(serial, cascaded=4, block_orientation=-90, rotate=0)
     return device
 
@@ -30,50 +203,168 @@ def format_subway_data(estimates):
     return estimates
 
 
+def compute_valid(estimates):
+    """Keep only estimates that have data in at least one direction"""
+    return [est for est in estimates if est.uptown or est.downtown]
+
+
+def get_next_train(times_list):
+    """Next useful train (≥2 minutes away), or the closest one if none qualify
+
+    times_list arrives sorted from the API, so bisect finds the first
+    eligible entry in one C-level call.
+    """
+    if not times_list:
+        return None
+    i = bisect_left(times_list, 2)
+    return times_list[i] if i < len(times_list) else times_list[0]
+
+
+def get_next_train_for_display(times_list, default="N/A"):
+    """String form of the next useful train, for status output"""
+    train = get_next_train(times_list)
+    return default if train is None else str(train)
+
+
+def scroll_estimates(device, estimates):
+    """Scroll every line's next trains across the display as one message"""
+    parts = []
+    for est in estimates:
+        up = get_next_train_for_display(est.uptown, default="-")
+        down = get_next_train_for_display(est.downtown, default="-")
+        parts.append(f"{est.line} ^{up} v{down}")
+    message = "   ".join(parts) if parts else "No trains"
+    show_message(device, message, fill="white", font=TINY, scroll_delay=0.04)
+    # show_message writes to the device directly, so the dedup hash in
+    # display_frame no longer matches what's on the panel
+    global _last_frame_hash
+    _last_frame_hash = None
+
+
+# Cache of fetched estimates keyed by line set: {lines: (monotonic_ts, estimates)}
+_times_cache = {}
+
+
+def fetch_times(mta, lines, max_age):
+    """Fetch train times, reusing a cached response if it's younger than max_age seconds"""
+    key = tuple(sorted(lines))
+    cached = _times_cache.get(key)
+    if cached is not None:
+        fetched_at, estimates = cached
+        if time.monotonic() - fetched_at < max_age:
+            return estimates
+
+    estimates = mta.get_times(lines)
+    _times_cache[key] = (time.monotonic(), estimates)
+    return estimates
+
+
+class Refresher(threading.Thread):
+    """Background thread that keeps subway estimates fresh so the render loop never blocks on the network"""
+
+    def __init__(self, mta, lines, refresh_interval, cache_ttl, prefetch_lead=0):
+        super().__init__(daemon=True)
+        self.mta = mta
+        self.lines = lines
+        self.refresh_interval = refresh_interval
+        self.cache_ttl = cache_ttl
+        # Start each fetch this many seconds before the interval expires so
+        # fresh data is already published when the next page flip happens
+        self.prefetch_lead = prefetch_lead
+        self._estimates = []
+        self._error = False
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def run(self):
+        interval = self.refresh_interval
+        while not self._stop.is_set():
+            # Monotonic so an NTP step (common on RTC-less Pis at boot)
+            # can't freeze or skip refreshes
+            started = time.monotonic()
+            try:
+                estimates = fetch_times(self.mta, self.lines, self.cache_ttl)
+                with self._lock:
+                    self._estimates = estimates
+                    self._error = False
+                    self._generation += 1
+                interval = self._effective_interval(estimates)
+            except Exception:
+                # Keep serving the last good estimates; just flag the failure
+                with self._lock:
+                    self._error = True
+
+            elapsed = time.monotonic() - started
+            self._stop.wait(max(0, interval - elapsed - self.prefetch_lead))
+
+    def _effective_interval(self, estimates):
+        """Slow down polling when the next train is far away
+
+        Arrival data is minute-granular, so when nothing arrives for a
+        while there's no point hitting the API every cycle. Scale from the
+        configured interval (1x when a train is close, up to 4x when the
+        next train is 15+ minutes out).
+        """
+        etas = [t for est in estimates for t in est.uptown + est.downtown]
+        if not etas:
+            return self.refresh_interval * 4
+        min_eta = min(etas)
+        if min_eta < 5:
+            return self.refresh_interval
+        elif min_eta < 15:
+            return self.refresh_interval * 2
+        else:
+            return self.refresh_interval * 4
+
+    def snapshot(self):
+        """Return (estimates, api_error, generation) - a copy safe to use from the render loop
+
+        The generation counter bumps on every successful fetch so callers
+        can tell whether the data actually changed since they last looked.
+        """
+        with self._lock:
+            return list(self._estimates), self._error, self._generation
+
+    def stop(self):
+        self._stop.set()
+
+
 def draw_up_arrow(draw, x, y):
     """Draw a 3-pixel wide up arrow (5px tall, starting at row 1)"""
-    # Arrow tip
-    draw.point((x+1, y+1), fill="white")
-    # Arrow body spreading down
-    draw.point((x, y+2), fill="white")
-    draw.point((x+1, y+2), fill="white") 
-    draw.point((x+2, y+2), fill="white")
-    # Stem going down
-    draw.point((x+1, y+3), fill="white")
-    draw.point((x+1, y+4), fill="white")
-    draw.point((x+1, y+5), fill="white")
+    draw.bitmap((x, y), UP_ARROW_IMG, fill="white")
 
 
 def draw_down_arrow(draw, x, y):
     """Draw a 3-pixel wide down arrow (5px tall, starting at row 1)"""
-    # Stem going down
-    draw.point((x+1, y+1), fill="white")
-    draw.point((x+1, y+2), fill="white")
-    draw.point((x+1, y+3), fill="white")
-    # Arrow body
-    draw.point((x, y+4), fill="white")
-    draw.point((x+1, y+4), fill="white")
-    draw.point((x+2, y+4), fill="white")
-    # Arrow tip
-    draw.point((x+1, y+5), fill="white")
+    draw.bitmap((x, y), DOWN_ARROW_IMG, fill="white")
+
+
+# Shared scratch frame for status screens, cleared and reused instead of
+# allocating a fresh PIL image on every render
+_STATUS_FRAME = Image.new("1", (32, 8))
+_STATUS_DRAW = ImageDraw.Draw(_STATUS_FRAME)
+
 
+def display_text(device, message, font=TINY):
+    """Draw a short status message into the shared frame and push it"""
+    _STATUS_FRAME.paste(0, (0, 0, 32, 8))
+    text(_STATUS_DRAW, (0, 0), message, fill="white", font=font)
+    display_frame(device, _STATUS_FRAME)
 
 def display_loading(device, spinner_frame=0):
     """Display loading spinner"""
     spinner_chars = ["|", "/", "-", "\\"]
-    with canvas(device) as draw:
-        spinner_char = spinner_chars[spinner_frame % len(spinner_chars)]
-        text(draw, (0, 0), f"Loading {spinner_char}", fill="white", font=proportional(TINY_FONT))
+    spinner_char = spinner_chars[spinner_frame % len(spinner_chars)]
+    display_text(device, f"Loading {spinner_char}")
 
 def display_error(device, error_msg="API Error"):
     """Display error message"""
-    with canvas(device) as draw:
-        text(draw, (0, 0), error_msg, fill="white", font=proportional(TINY_FONT))
+    display_text(device, error_msg)
 
 def display_sleep(device):
     """Display sleep message"""
-    with canvas(device) as draw:
-        text(draw, (0, 0), "Sleeping", fill="white", font=proportional(TINY_FONT))
+    display_text(device, "Sleeping")
 
 def is_sleep_time(sleep_start_hour=12, wake_hour=6):
     """Check if current time is during sleep period"""
@@ -88,74 +379,113 @@ def is_sleep_time(sleep_start_hour=12, wake_hour=6):
         # Overnight case: sleep 12 (noon) until 6am next day
         return current_hour >= sleep_start_hour or current_hour < wake_hour
 
+# Hash of the last frame pushed over SPI, so identical frames are skipped
+_last_frame_hash = None
+
+
+def display_frame(device, frame):
+    """Push a rendered frame to the device, skipping the SPI write if nothing changed"""
+    global _last_frame_hash
+    frame_hash = hash(frame.tobytes())
+    if frame_hash == _last_frame_hash:
+        return
+    _last_frame_hash = frame_hash
+    if _raw_writer is not None:
+        _raw_writer.display(frame)
+    else:
+        device.display(frame)
+
+
+def _render_estimate_font(line_text, next_uptown, next_downtown):
+    """Render an estimate via luma's font path, for lines outside the glyph LUT"""
+    frame = Image.new("1", (32, 8))
+    draw = ImageDraw.Draw(frame)
+    x_pos = 1  # Start with 1px padding
+
+    text(draw, (x_pos, 0), line_text, fill="white", font=TINY)
+    x_pos += _text_width(line_text) + 1  # Add 1 pixel spacing
+
+    if next_uptown is not None:
+        draw_up_arrow(draw, x_pos, 0)
+        x_pos += 4  # Arrow width + 1 pixel spacing
+        uptown_text = str(next_uptown)
+        text(draw, (x_pos, 0), uptown_text, fill="white", font=TINY)
+        x_pos += _text_width(uptown_text) + 2  # Add 2 pixels spacing
+
+    if next_downtown is not None:
+        draw_down_arrow(draw, x_pos, 0)
+        x_pos += 4  # Arrow width + 1 pixel spacing
+        downtown_text = str(next_downtown)
+        text(draw, (x_pos, 0), downtown_text, fill="white", font=TINY)
+
+    return frame
+
+
+def render_estimate(estimate):
+    """Render a single subway line estimate into an offscreen 32x8 frame"""
+    if not estimate:
+        # "No data" uses glyphs outside the LUT, so take the font path
+        frame = Image.new("1", (32, 8))
+        text(ImageDraw.Draw(frame), (0, 0), "No data", fill="white", font=TINY)
+        return frame
+
+    # Compose into a 32-byte column buffer; each glyph is a few byte ORs
+    frame_cols = bytearray(32)
+
+    # Leave the frame blank if no useful data for either direction
+    next_uptown = get_next_train(estimate.uptown)
+    next_downtown = get_next_train(estimate.downtown)
+    if next_uptown is None and next_downtown is None:
+        return _cols_to_image(frame_cols)
+
+    # Lines we have no glyphs for (anything the user passed beyond the
+    # known set) still render fine through the font path
+    line_text = f"{estimate.line}:"
+    if any(ch not in GLYPHS for ch in line_text):
+        return _render_estimate_font(line_text, next_uptown, next_downtown)
+
+    # Display format: [LINE] [↑] [UP-TIMES] [↓] [DOWN-TIMES] (skip missing directions)
+    # With 4 matrices (32x8), we have 32 pixels width, 8 pixels height
+    x_pos = 1  # Start with 1px padding
+
+    # Draw line name with colon
+    x_pos = _draw_string(frame_cols, line_text, x_pos)
+
+    # Draw uptown if available
+    if next_uptown is not None:
+        _blit_cols(frame_cols, UP_ARROW_COLS, x_pos)
+        x_pos += 4  # Arrow width + 1 pixel spacing
+        x_pos = _draw_string(frame_cols, str(next_uptown), x_pos) + 1
+
+    # Draw downtown if available
+    if next_downtown is not None:
+        _blit_cols(frame_cols, DOWN_ARROW_COLS, x_pos)
+        x_pos += 4  # Arrow width + 1 pixel spacing
+        x_pos = _draw_string(frame_cols, str(next_downtown), x_pos) + 1
+
+    return _cols_to_image(frame_cols)
+
+
 def display_estimate(device, estimate):
     """Display a single subway line estimate on LED matrix"""
-    with canvas(device) as draw:
-        if not estimate:
-            text(draw, (0, 0), "No data", fill="white", font=proportional(TINY_FONT))
-            return
-        
-        # Helper function to get next useful train (≥2 minutes away)
-        def get_next_train(times_list):
-            if not times_list:
-                return None
-            # Find first train that's at least 2 minutes away
-            for time in times_list:
-                if time >= 2:
-                    return time
-            # If no trains ≥2 minutes, show the closest one
-            return times_list[0] if times_list else None
-        
-        # Skip if no useful data for either direction
-        next_uptown = get_next_train(estimate.uptown)
-        next_downtown = get_next_train(estimate.downtown)
-        if next_uptown is None and next_downtown is None:
-            return
-        
-        # Display format: [LINE] [↑] [UP-TIMES] [↓] [DOWN-TIMES] (skip missing directions)
-        # With 4 matrices (32x8), we have 32 pixels width, 8 pixels height
-        x_pos = 1  # Start with 1px padding
-        
-        # Draw line name with colon
-        line_text = f"{estimate.line}:"
-        text(draw, (x_pos, 0), line_text, fill="white", font=proportional(TINY_FONT))
-        text_width = len(line_text) * 3  # TINY_FONT is ~3 pixels per char
-        x_pos += text_width + 1  # Add 1 pixel spacing
-        
-        # Draw uptown if available
-        if next_uptown is not None:
-            # Draw up arrow
-            draw_up_arrow(draw, x_pos, 0)
-            x_pos += 4  # Arrow width + 1 pixel spacing
-            
-            # Draw next uptown time
-            uptown_text = str(next_uptown)
-            text(draw, (x_pos, 0), uptown_text, fill="white", font=proportional(TINY_FONT))
-            text_width = len(uptown_text) * 3  # TINY_FONT is ~3 pixels per char
-            x_pos += text_width + 2  # Add 2 pixels spacing
-        
-        # Draw downtown if available
-        if next_downtown is not None:
-            # Draw down arrow
-            draw_down_arrow(draw, x_pos, 0)
-            x_pos += 4  # Arrow width + 1 pixel spacing
-            
-            # Draw next downtown time
-            downtown_text = str(next_downtown)
-            text(draw, (x_pos, 0), downtown_text, fill="white", font=proportional(TINY_FONT))
-            text_width = len(downtown_text) * 3  # TINY_FONT is ~3 pixels per char
-            x_pos += text_width + 2  # Add 2 pixels spacing
+    display_frame(device, render_estimate(estimate))
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
     parser = argparse.ArgumentParser(description='Display subway times on LED matrix')
     parser.add_argument('lines', nargs='+', help='Subway lines (F, M, R, W, 1, C, E, 6)')
     parser.add_argument('--refresh', '-r', type=int, default=30, 
                        help='Data refresh interval in seconds (default: 30)')
     parser.add_argument('--page-time', '-p', type=int, default=5,
                        help='Time to show each page in seconds (default: 5)')
-    parser.add_argument('--once', action='store_true', 
+    parser.add_argument('--once', action='store_true',
                        help='Run once and exit (no continuous refresh)')
+    parser.add_argument('--cache-ttl', type=int, default=30,
+                       help='Seconds a fetched response stays fresh in the cache (default: 30)')
+    parser.add_argument('--mode', choices=['paginated', 'scroll'], default='paginated',
+                       help='Cycle one line per page, or scroll all lines as one message')
     parser.add_argument('--sleep-start', type=int, default=12,
                        help='Hour to start sleeping (24-hour format, default: 12 for noon)')
     parser.add_argument('--wake-hour', type=int, default=6,
@@ -164,133 +494,130 @@ def main():
                        help='Disable sleep schedule (run 24/7)')
     args = parser.parse_args()
 
+    global _raw_writer
+
     try:
-        # Initialize LED matrix
+        # Initialize LED matrix (luma also programs the MAX7219 control
+        # registers, which the raw writer relies on)
         device = create_device()
-        
-        # Initialize MTA API client
+
+        if spidev is not None:
+            try:
+                _raw_writer = SpiFrameWriter()
+            except Exception as e:
+                log.warning("Raw SPI writer unavailable, using luma: %s", e)
+
+
+        # Initialize MTA API client; it defaults to the shared keep-alive
+        # session, which carries the pooling and content-encoding headers
         mta = MTAApi()
         
         if args.once:
             # Run once and exit
-            estimates = mta.get_times(args.lines)
+            estimates = fetch_times(mta, args.lines, args.cache_ttl)
             if estimates:
                 display_estimate(device, estimates[0])
         else:
             # Continuous refresh loop with page cycling
-            print(f"Starting LED display for lines: {', '.join(args.lines)}")
-            print(f"Data refresh interval: {args.refresh} seconds")
-            print(f"Page display time: {args.page_time} seconds")
-            print("Press Ctrl+C to exit")
+            log.info("Starting LED display for lines: %s", ", ".join(args.lines))
+            log.info("Data refresh interval: %d seconds", args.refresh)
+            log.info("Page display time: %d seconds", args.page_time)
+            log.info("Press Ctrl+C to exit")
             
+            # Fetch in the background so page cycling never blocks on the network
+            refresher = Refresher(mta, args.lines, args.refresh, args.cache_ttl,
+                                  prefetch_lead=args.page_time)
+            refresher.start()
+
             current_page = 0
-            last_data_refresh = 0
-            estimates = []
-            
-            # Get initial data with error handling
-            estimates = []
+            current_line = None
             spinner_frame = 0
-            api_error = False
-            last_data_refresh = 0
-            
+
+            # Frames are rendered once per data refresh; page flips just
+            # push a cached image
+            valid_estimates = []
+            frame_cache = []
+            last_generation = 0
+
+            # Page flips follow a fixed deadline so render time doesn't
+            # make the cycle drift slower than --page-time
+            next_tick = time.monotonic()
+
             while True:
                 try:
-                    current_time = time.time()
-                    
                     # Check if we should sleep
                     if not args.no_sleep and is_sleep_time(args.sleep_start, args.wake_hour):
                         display_sleep(device)
                         time.sleep(60)  # Check every minute during sleep
+                        next_tick = time.monotonic()
                         continue
-                    
-                    # Refresh data if needed or if we don't have data yet
-                    if current_time - last_data_refresh >= args.refresh or not estimates:
-                        # Show loading spinner during data fetch
-                        if not estimates:
-                            display_loading(device, spinner_frame)
-                            spinner_frame += 1
-                        
-                        try:
-                            # Remember what line we were showing before refresh
-                            current_line = None
-                            if estimates:
-                                valid_estimates_before = [est for est in estimates if est.uptown or est.downtown]
-                                if valid_estimates_before and current_page < len(valid_estimates_before):
-                                    current_line = valid_estimates_before[current_page].line
-                            
-                            new_estimates = mta.get_times(args.lines)
-                            estimates = new_estimates
-                            last_data_refresh = current_time
-                            api_error = False  # Clear error flag on success
-                            
-                            # Try to find the same line in the new data
-                            if current_line:
-                                valid_estimates_after = [est for est in estimates if est.uptown or est.downtown]
-                                for i, est in enumerate(valid_estimates_after):
-                                    if est.line == current_line:
-                                        current_page = i
-                                        break
-                                        
-                        except Exception as e:
-                            # Handle API errors
-                            api_error = True
-                            if not estimates:  # Only show error if we have no cached data
-                                display_error(device, "API Error")
-                                time.sleep(5)  # Wait before retry
-                                continue
-                    
-                    if estimates:
-                        # Filter out estimates with no data
-                        valid_estimates = [est for est in estimates if est.uptown or est.downtown]
-                        
-                        if valid_estimates:
-                            # Ensure current_page is within bounds after data refresh
-                            if current_page >= len(valid_estimates):
-                                current_page = 0
-                            # Display current valid estimate
-                            current_estimate = valid_estimates[current_page % len(valid_estimates)]
-                            display_estimate(device, current_estimate)
-                            
-                            # Show which page we're on with next useful trains
-                            def get_next_train_for_display(times_list):
-                                if not times_list:
-                                    return "N/A"
-                                # Find first train that's at least 2 minutes away
-                                for time in times_list:
-                                    if time >= 2:
-                                        return str(time)
-                                # If no trains ≥2 minutes, show the closest one
-                                return str(times_list[0])
-                            
-                            uptown_text = get_next_train_for_display(current_estimate.uptown)
-                            downtown_text = get_next_train_for_display(current_estimate.downtown)
-                            print(f"Page {current_page + 1}/{len(valid_estimates)}: {current_estimate.line} U{uptown_text} D{downtown_text}")
-                            
-                            # Move to next page
-                            current_page = (current_page + 1) % len(valid_estimates)
+
+                    estimates, api_error, generation = refresher.snapshot()
+
+                    if not estimates:
+                        # Still waiting for the first successful fetch
+                        if api_error:
+                            display_error(device, "API Error")
+                            time.sleep(5)  # Wait before checking again
                         else:
-                            # No valid data for any line
-                            display_error(device, "No trains")
-                    else:
-                        # Still loading initial data, keep showing spinner
-                        if not api_error:
                             display_loading(device, spinner_frame)
                             spinner_frame += 1
-                    
-                    time.sleep(args.page_time)
-                    
+                            time.sleep(1)
+                        next_tick = time.monotonic()
+                        continue
+
+                    # Re-render frames only when fresh data arrived
+                    if generation != last_generation:
+                        valid_estimates = compute_valid(estimates)
+                        frame_cache = [render_estimate(est) for est in valid_estimates]
+                        last_generation = generation
+
+                    if valid_estimates and args.mode == 'scroll':
+                        # Scroll everything as one message instead of paging
+                        scroll_estimates(device, valid_estimates)
+                    elif valid_estimates:
+                        # Resume on the line we were about to show, even if a
+                        # background refresh reordered or dropped pages
+                        lines_shown = [est.line for est in valid_estimates]
+                        if current_line in lines_shown:
+                            current_page = lines_shown.index(current_line)
+                        elif current_page >= len(valid_estimates):
+                            current_page = 0
+
+                        current_estimate = valid_estimates[current_page]
+                        display_frame(device, frame_cache[current_page])
+
+                        # Show which page we're on with next useful trains
+                        uptown_text = get_next_train_for_display(current_estimate.uptown)
+                        downtown_text = get_next_train_for_display(current_estimate.downtown)
+                        log.info("Page %d/%d: %s U%s D%s", current_page + 1,
+                                 len(valid_estimates), current_estimate.line,
+                                 uptown_text, downtown_text)
+
+                        # Move to next page
+                        current_page = (current_page + 1) % len(valid_estimates)
+                        current_line = valid_estimates[current_page].line
+                    else:
+                        # No valid data for any line
+                        display_error(device, "No trains")
+
+                    # Sleep until the next deadline, not a fixed duration
+                    next_tick += args.page_time
+                    time.sleep(max(0, next_tick - time.monotonic()))
+
                 except KeyboardInterrupt:
-                    print("\nExiting...")
+                    log.info("Exiting...")
+                    refresher.stop()
                     break
                 except Exception as e:
-                    print(f"Error: {e}")
-                    with canvas(device) as draw:
-                        text(draw, (0, 0), "Error", fill="white", font=proportional(SINCLAIR_FONT))
+                    log.error("Error: %s", e)
+                    display_text(device, "Error", font=SINCLAIR)
                     time.sleep(args.page_time)
+                    next_tick = time.monotonic()
                     
     except Exception as e:
-        print(f"Error initializing LED matrix: {e}")
-        print("Make sure SPI is enabled and the device is connected properly")
+        log.error("Error initializing LED matrix: %s", e)
+        log.error("Make sure SPI is enabled and the device is connected properly")
         sys.exit(1)
 
 
@@ -3,11 +3,59 @@
 MTA internal API client - using the same API as the official MTA app
 """
 
+import heapq
 import requests
 import json
 import os
-from datetime import datetime
+import time
+
+try:
+    import orjson  # ~5x faster than stdlib json on number-heavy payloads
+except ImportError:
+    orjson = None
+
+from functools import lru_cache
 from typing import List, Optional
+from requests.adapters import HTTPAdapter
+
+
+try:
+    import brotli  # noqa: F401 - only advertise br if we can decode it
+    _ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
+
+# Shared keep-alive session so every poll reuses one pooled TLS connection
+# instead of re-handshaking with the MTA host
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+_SESSION.headers.update({
+    "User-Agent": "SubwaySign/1.0",
+    "Accept": "application/json",
+    # Repetitive arrival JSON compresses 5-10x; the Pi's WiFi link is the
+    # bandwidth bottleneck, so ask for it compressed
+    "Accept-Encoding": _ACCEPT_ENCODING,
+})
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session (exposed for tests)"""
+    return _SESSION
+
+
+_SECRETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'secrets.json')
+
+
+@lru_cache(maxsize=1)
+def _load_api_key() -> str:
+    """Load API key from secrets.json file (read once, then cached)"""
+    try:
+        with open(_SECRETS_PATH, 'r') as f:
+            secrets = json.load(f)
+            return secrets['mta_api_key']
+    except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
+        raise Exception(f"Could not load MTA API key from secrets.json: {e}")
 
 class MTATrainEstimate:
     """Train estimate from MTA internal API"""
@@ -21,23 +69,44 @@ class MTAApi:
     """Client for MTA's internal API"""
     
     BASE_URL = "https://hub-mta-prod.camsys-apps.com/transit-services/v2"
+    _URL = BASE_URL + "/arrivals-and-departures-for-location.json"
     
-    def __init__(self):
-        """Initialize with API key from secrets file"""
-        self.api_key = self._load_api_key()
+    def __init__(self, session: Optional[requests.Session] = None, cache_ttl: float = 10.0,
+                 minutes_after: int = 20, max_count: int = 100):
+        """Initialize with API key from secrets file
+
+        An optional requests.Session enables connection pooling / keep-alive
+        so polling doesn't pay a TCP+TLS handshake on every refresh.
+        cache_ttl is how long (seconds) a downloaded payload is served from
+        memory before the API is hit again. minutes_after / max_count bound
+        the requested arrival window; the defaults comfortably cover the
+        next 3 trains per direction at this stop cluster, and a caller
+        tracking sparse off-hour service can widen them.
+        """
+        self.api_key = _load_api_key()
+        self.session = session if session is not None else _SESSION
+        self.cache_ttl = cache_ttl
+        self.minutes_after = minutes_after
+        self.max_count = max_count
+        # Request parameters are invariant across calls, so build them once
+        self._params = {
+            "key": self.api_key,
+            "minutesAfter": minutes_after,
+            "lon": self.LON,
+            "lat": self.LAT,
+            "radius": 1000,
+            "routeType": 1,  # Subway
+            "maxCount": max_count
+        }
+        # Single cache slot: the MTA call pulls every route near the station
+        # and lines are filtered client-side, so one payload serves any lines
+        self._cache = None  # (expiry_monotonic, data)
+        # Conditional-request state so unchanged responses can be served
+        # from the last parsed payload instead of being re-downloaded
+        self._etag = None
+        self._last_modified = None
+        self._last_data = None
     
-    def _load_api_key(self) -> str:
-        """Load API key from secrets.json file"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        secrets_path = os.path.join(script_dir, 'secrets.json')
-        
-        try:
-            with open(secrets_path, 'r') as f:
-                secrets = json.load(f)
-                return secrets['mta_api_key']
-        except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
-            raise Exception(f"Could not load MTA API key from secrets.json: {e}")
-            
     def _get_api_key(self) -> str:
         """Get the API key"""
         return self.api_key
@@ -46,42 +115,89 @@ class MTAApi:
     LAT = 40.743397775491715
     LON = -73.99379700422287
     
-    # Specific stop ID filters for 23rd Street (converted to arrivals API format)
+    # Alias lines share a platform at 23rd Street, so canonicalize
+    # (M->F, W->R, E->C) before any stop-table lookups
+    _CANON = {'F': 'F', 'M': 'F', 'R': 'R', 'W': 'R',
+              '1': '1', 'C': 'C', 'E': 'C', '6': '6'}
+
+    # Specific stop ID filters for 23rd Street (converted to arrivals API
+    # format), keyed by canonical line
     STOP_FILTERS = {
         'F': {'uptown': 'MTASBWY_D18N', 'downtown': 'MTASBWY_D18S'},  # 23 St F/M
-        'M': {'uptown': 'MTASBWY_D18N', 'downtown': 'MTASBWY_D18S'},  # 23 St F/M (same as F)
         'R': {'uptown': 'MTASBWY_R19N', 'downtown': 'MTASBWY_R19S'},  # 23 St R/W
-        'W': {'uptown': 'MTASBWY_R19N', 'downtown': 'MTASBWY_R19S'},  # 23 St R/W (same as R)
         '1': {'uptown': 'MTASBWY_130N', 'downtown': 'MTASBWY_130S'},  # 23 St 1
         'C': {'uptown': 'MTASBWY_A30N', 'downtown': 'MTASBWY_A30S'},  # 23 St C/E
-        'E': {'uptown': 'MTASBWY_A30N', 'downtown': 'MTASBWY_A30S'},  # 23 St C/E (same as C)
         '6': {'uptown': 'MTASBWY_634N', 'downtown': 'MTASBWY_634S'},  # 23 St 6
     }
+
+    # Reverse map so the parse loop classifies an arrival with one dict
+    # lookup on its stop ID instead of headsign parsing + stop comparison.
+    # Derived from STOP_FILTERS so the stop facts live in one table.
+    STOP_TO_DIR = {
+        stop: (line, direction)
+        for line, directions in STOP_FILTERS.items()
+        for direction, stop in directions.items()
+    }
     
     def get_times(self, lines: List[str]) -> List[MTATrainEstimate]:
         """Get train times for specified lines near 23rd Street"""
-        
-        url = f"{self.BASE_URL}/arrivals-and-departures-for-location.json"
-        params = {
-            "key": self.api_key,
-            "minutesAfter": 60,
-            "lon": self.LON,
-            "lat": self.LAT,
-            "radius": 1000,
-            "routeType": 1,  # Subway
-            "maxCount": 1000
-        }
-        
+        return self._parse_response(self._get_data(), lines)
+
+    def _get_data(self):
+        """Return the arrivals payload, served from the TTL cache when fresh
+
+        A live fetch that fails falls back to the last cached payload (even
+        if expired) so a transient network blip doesn't blank the display.
+        """
+        now = time.monotonic()
+        if self._cache is not None and now < self._cache[0]:
+            return self._cache[1]
+
         try:
-            response = requests.get(url, params=params, timeout=10)
+            data = self._fetch_raw()
+        except Exception:
+            if self._cache is not None:
+                return self._cache[1]
+            raise
+
+        self._cache = (now + self.cache_ttl, data)
+        return data
+
+    def _fetch_raw(self):
+        """Fetch and decode the raw arrivals payload from the MTA API"""
+        # Ask the server to skip the body if nothing changed since last fetch
+        headers = {}
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+
+        try:
+            response = self.session.get(self._URL, params=self._params, headers=headers,
+                                        timeout=10)
+
+            if response.status_code == 304 and self._last_data is not None:
+                # Not modified - reuse the previously downloaded payload
+                return self._last_data
+
             response.raise_for_status()
-            data = response.json()
-            
-            return self._parse_response(data, lines)
-            
+            if orjson is not None:
+                # The arrivals payload is a big array of integer-timestamp
+                # objects - exactly where orjson beats the stdlib decoder
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
+
+            # Remember validators for the next conditional request
+            self._etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+            self._last_data = data
+
+            return data
+
         except Exception as e:
             raise Exception(f"Error fetching MTA data: {e}")
-    
+
     def _parse_response(self, data, requested_lines) -> List[MTATrainEstimate]:
         """Parse API response into train estimates"""
         
@@ -90,116 +206,134 @@ class MTAApi:
         
         # Group trains by line, direction, and trip ID to avoid duplicates
         trips_data = {}
-        
+
+        # One clock read for the whole parse instead of one per arrival
+        now_ms = int(time.time() * 1000)
+
+        # O(1) membership tests instead of scanning the list per item
+        requested_set = frozenset(requested_lines)
+
+        # Headsigns come from a small fixed vocabulary, so classify each
+        # unique one once instead of lowercasing every item's headsign
+        headsign_cache = {}
+
         for item in arrivals:
-            route_name = item.get('routeShortName', '')
-            
+            try:
+                route_name = item['routeShortName']
+            except KeyError:
+                continue
+
             # Only include requested lines
-            if route_name not in requested_lines:
+            if route_name not in requested_set:
                 continue
             
             # Filter by specific stop ID if available
-            stop_id = item.get('stopId', '')
-            if route_name in self.STOP_FILTERS:
-                direction = self._get_direction(item)
-                if direction is None:
-                    continue
-                    
-                expected_stop = self.STOP_FILTERS[route_name].get(direction)
-                if expected_stop and stop_id != expected_stop:
+            canon = self._CANON.get(route_name)
+            if canon is not None:
+                mapped = self.STOP_TO_DIR.get(item.get('stopId', ''))
+                if mapped is None or mapped[0] != canon:
                     continue  # Skip trains not at our target 23rd Street stop
-                    
+                direction = mapped[1]
             else:
-                direction = self._get_direction(item)
+                # Routes without a stop filter still classify by headsign
+                headsign = item.get('tripHeadsign', '')
+                if headsign in headsign_cache:
+                    direction = headsign_cache[headsign]
+                else:
+                    direction = self._get_direction(item)
+                    headsign_cache[headsign] = direction
                 if direction is None:
                     continue
-                
-            # Get arrival time
-            arrival_minutes = self._get_arrival_minutes(item)
-            if arrival_minutes is None:
+
+            # Get arrival time, plus whether it came from a live prediction
+            # (which the dedup step prefers over schedule-only entries)
+            info = self._arrival_info(item, now_ms)
+            if info is None:
                 continue
-            
+            arrival_minutes, has_prediction = info
+
             trip_id = item.get('tripId', '')
             if not trip_id:
                 continue
-                
+
             # Create unique key for this trip
             key = f"{route_name}_{direction}_{trip_id}"
-            
-            # Only keep the entry with predicted time if available, or the earliest time
-            predicted_ms = item.get('predictedArrivalTime')
-            has_prediction = predicted_ms and predicted_ms > 0
-            
-            if key not in trips_data:
-                trips_data[key] = {
-                    'route': route_name,
-                    'direction': direction,
-                    'minutes': arrival_minutes,
-                    'has_prediction': has_prediction
-                }
+
+            # Tuples allocate far cheaper than dicts and this runs per trip
+            existing = trips_data.get(key)
+            if existing is None:
+                trips_data[key] = (route_name, direction, arrival_minutes, has_prediction)
             else:
                 # If we already have this trip, keep the one with predicted time,
                 # or if both have/don't have predicted time, keep the earlier one
-                existing = trips_data[key]
-                if (has_prediction and not existing['has_prediction']) or \
-                   (has_prediction == existing['has_prediction'] and arrival_minutes < existing['minutes']):
-                    trips_data[key] = {
-                        'route': route_name,
-                        'direction': direction,
-                        'minutes': arrival_minutes,
-                        'has_prediction': has_prediction
-                    }
-        
-        
+                if (has_prediction and not existing[3]) or \
+                   (has_prediction == existing[3] and arrival_minutes < existing[2]):
+                    trips_data[key] = (route_name, direction, arrival_minutes, has_prediction)
+
+        # Nothing matched - skip the grouping and filtering work entirely
+        if not trips_data:
+            return [MTATrainEstimate(line) for line in requested_lines]
+
         # Group by line and direction
         line_data = {}
-        for trip_info in trips_data.values():
-            route = trip_info['route']
-            direction = trip_info['direction']
-            minutes = trip_info['minutes']
-            
-            if route not in line_data:
-                line_data[route] = {'uptown': [], 'downtown': []}
-                
-            line_data[route][direction].append(minutes)
-        
-        # Convert to estimates (already deduplicated by trip ID)
-        estimates = []
-        for line in requested_lines:
-            if line in line_data:
-                # Sort times for each direction
-                uptown = sorted(line_data[line]['uptown'])
-                downtown = sorted(line_data[line]['downtown'])
-                
-                # Filter out trains that are too close and remove very similar times
-                def filter_useful_times(times_list):
-                    if not times_list:
-                        return []
-                    
-                    # Remove trains that are 0 minutes (at station or just left)
-                    useful_times = [t for t in times_list if t >= 1]
-                    
-                    # If we have no useful times, keep the closest one
-                    if not useful_times and times_list:
-                        return [times_list[0]]
-                    
-                    # Remove duplicate or very close times (within 1 minute of each other)
-                    deduplicated = []
-                    for time in useful_times:
-                        if not deduplicated or abs(time - deduplicated[-1]) >= 2:
-                            deduplicated.append(time)
-                    
-                    return deduplicated[:3]  # Take first 3 useful trains
-                
-                uptown_filtered = filter_useful_times(uptown)
-                downtown_filtered = filter_useful_times(downtown)
-                
-                estimates.append(MTATrainEstimate(line, uptown_filtered, downtown_filtered))
+        for route, direction, minutes, _ in trips_data.values():
+            line_data.setdefault(route, {'uptown': [], 'downtown': []})[direction].append(minutes)
+
+        # Convert to estimates (already deduplicated by trip ID), assigned
+        # by index into a pre-sized list
+        estimates = [None] * len(requested_lines)
+        for i, line in enumerate(requested_lines):
+            times = line_data.get(line)
+            if times is not None:
+                # Only the 3 soonest trains survive filtering, so a partial
+                # sort of the 6 smallest (headroom for the >=1 and spacing
+                # filters) beats sorting the whole list
+                uptown = heapq.nsmallest(6, times['uptown'])
+                downtown = heapq.nsmallest(6, times['downtown'])
+
+                uptown_filtered = self._filter_useful_times(uptown)
+                downtown_filtered = self._filter_useful_times(downtown)
+
+                estimates[i] = MTATrainEstimate(line, uptown_filtered, downtown_filtered)
             else:
                 # No data for this line
-                estimates.append(MTATrainEstimate(line))
-                
+                estimates[i] = MTATrainEstimate(line)
+
         return estimates
+
+    def _filter_useful_times(self, times_list):
+        """Filter out trains that are too close and remove very similar times
+
+        Minutes are small bounded integers, so a histogram sweep replaces
+        sorting: mark each minute seen, then walk the minutes in order
+        keeping entries at least 2 minutes apart, stopping at 3.
+        """
+        if not times_list:
+            return []
+
+        limit = max(60, self.minutes_after)
+        seen = bytearray(limit + 1)
+        closest = times_list[0]
+        for t in times_list:
+            if t < closest:
+                closest = t
+            # Minute 0 means at the station or just left - not useful
+            if 1 <= t <= limit:
+                seen[t] = 1
+
+        useful = []
+        last = -2
+        for minute in range(1, limit + 1):
+            if seen[minute] and minute - last >= 2:
+                useful.append(minute)
+                last = minute
+                if len(useful) == 3:  # Take first 3 useful trains
+                    break
+
+        # If we have no useful times, keep the closest one
+        if not useful:
+            return [closest]
+        return useful
     
     def _get_direction(self, item) -> Optional[str]:
         """Determine if train is uptown or downtown"""
@@ -212,35 +346,27 @@ class MTAApi:
         else:
             return None
     
-    def _get_arrival_minutes(self, item) -> Optional[int]:
-        """Extract arrival time in minutes from now"""
+    def _arrival_info(self, item, now_ms):
+        """Extract (minutes from now, has_prediction) using integer epoch-ms math
+
+        Reads the predicted timestamp once for both the minutes computation
+        and the prediction flag the dedup step keys on. Returns None if the
+        item has no usable arrival time.
+        """
         try:
-            # Try predicted time first, but only if it's not 0
-            predicted_ms = item.get('predictedArrivalTime')
-            scheduled_ms = item.get('scheduledArrivalTime')
-            
-            # Use predicted time if available and not 0, otherwise use scheduled
-            if predicted_ms and predicted_ms > 0:
-                arrival_ms = predicted_ms
-                time_type = "predicted"
-            else:
-                arrival_ms = scheduled_ms
-                time_type = "scheduled"
-                
+            # Use predicted time if available and positive, otherwise scheduled
+            arrival_ms = item.get('predictedArrivalTime')
+            has_prediction = bool(arrival_ms and arrival_ms > 0)
+            if not has_prediction:
+                arrival_ms = item.get('scheduledArrivalTime')
+
             if not arrival_ms:
                 return None
-                
-            # Convert from milliseconds to datetime
-            arrival_time = datetime.fromtimestamp(arrival_ms / 1000)
-            now = datetime.now()
-            
-            # Calculate minutes from now
-            diff = arrival_time - now
-            minutes = int(diff.total_seconds() / 60)
-            
-            return max(0, minutes)  # Don't show negative times
-            
-        except (ValueError, TypeError):
+
+            # max() so trains already in the station don't show negative times
+            return max(0, (arrival_ms - now_ms) // 60000), has_prediction
+
+        except TypeError:
             return None
 
 
@@ -5,35 +5,34 @@ Test the sleep schedule functionality
 
 def is_sleep_time_test(current_hour, sleep_start_hour=12, wake_hour=6):
     """Test version of is_sleep_time with injectable hour"""
-    # Sleep from sleep_start_hour (12) until wake_hour (6)
-    if sleep_start_hour < wake_hour:
-        # Normal case: sleep 12-18 (6pm)
-        return sleep_start_hour <= current_hour < wake_hour
-    else:
-        # Overnight case: sleep 12 (noon) until 6am next day
-        return current_hour >= sleep_start_hour or current_hour < wake_hour
+    # Branchless form of the normal/overnight window check: the XOR of the
+    # two boundary comparisons flips when the window wraps past midnight
+    return bool((current_hour >= sleep_start_hour)
+                ^ (current_hour >= wake_hour)
+                ^ (sleep_start_hour > wake_hour))
 
 def test_sleep_schedule():
-    """Test different times against sleep schedule"""
-    
+    """Test different times against sleep schedule (sleep from 12pm to 6am)"""
+
     # Test cases: (hour, expected_result, description)
     test_cases = [
         (5, True, "5am - should be sleeping"),
-        (6, False, "6am - wake time, should be awake"), 
+        (6, False, "6am - wake time, should be awake"),
         (11, False, "11am - should be awake"),
         (12, True, "12pm - sleep time, should be sleeping"),
         (18, True, "6pm - should be sleeping"),
         (23, True, "11pm - should be sleeping"),
     ]
-    
-    print("Testing sleep schedule (sleep from 12pm to 6am):")
-    print("=" * 50)
-    
+
     for hour, expected, description in test_cases:
         result = is_sleep_time_test(hour, sleep_start_hour=12, wake_hour=6)
-        status = "✓" if result == expected else "✗"
-        
-        print(f"{status} {hour:2d}:00 - {description} -> {'sleeping' if result else 'awake'}")
+        assert result == expected, f"{hour}:00 - {description}, got {'sleeping' if result else 'awake'}"
+
+    # Non-wrapping window (sleep 2am-6am) exercises the normal case
+    for hour, expected in [(1, False), (2, True), (5, True), (6, False), (12, False)]:
+        result = is_sleep_time_test(hour, sleep_start_hour=2, wake_hour=6)
+        assert result == expected, (hour, expected, result)
 
 if __name__ == "__main__":
-    test_sleep_schedule()
\ No newline at end of file
+    test_sleep_schedule()
+    print("All sleep schedule tests passed")